@@ -1,4 +1,4 @@
-import os
+import subprocess
 from pyngrok import ngrok
 
 # Define the port Streamlit runs on
@@ -8,5 +8,14 @@ port = 8501
 public_url = ngrok.connect(port)
 print(f"🔗 Public URL: {public_url}")
 
-# Run your Streamlit app
-os.system(f"streamlit run app.py --server.port {port}")
+# Run the Streamlit app directly (no intermediate shell process)
+proc = subprocess.Popen(["streamlit", "run", "app.py", "--server.port", str(port)])
+
+try:
+    proc.wait()
+except KeyboardInterrupt:
+    # Ctrl+C: stop Streamlit before tearing down the tunnel
+    proc.terminate()
+    proc.wait()
+finally:
+    ngrok.kill()
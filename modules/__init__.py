@@ -8,11 +8,17 @@ This package contains modules for the earthquake catastrophe modeling system:
 - Financial Module: Calculates economic impact
 """
 
-from .event_module import calculate_event_score, assign_event_risk_zone
-from .hazard_module import calculate_hazard_score, categorize_hazard_level
+from .event_module import calculate_event_score, calculate_event_score_vec, assign_event_risk_zone
+from .hazard_module import (
+    calculate_hazard_score, calculate_hazard_score_vec,
+    categorize_hazard_level, categorize_hazard_level_vec
+)
 from .vulnerability_module import (
     get_material_factor, get_age_factor, get_density_factor, get_hazard_factor,
-    calculate_vulnerability_score, categorize_damage_level
+    factor_lookup_vec, calculate_vulnerability_score, categorize_damage_level
+)
+from .financial_module import (
+    estimate_building_value, estimate_building_value_vec,
+    calculate_financial_impact, calculate_financial_impact_vec
 )
-from .financial_module import estimate_building_value, calculate_financial_impact
-from .utils import load_data, format_currency
\ No newline at end of file
+from .utils import load_data, format_currency, format_currency_series
\ No newline at end of file
@@ -1,7 +1,20 @@
 import numpy as np
 import pandas as pd
 from math import log
-from sklearn.cluster import KMeans
+from scipy.cluster.vq import kmeans2
+from sklearn.cluster import MiniBatchKMeans
+
+# numexpr is optional: when installed, it fuses the event-score
+# expression into one multithreaded pass with no intermediate arrays,
+# which pays off on large frames.
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Row count above which the numexpr path beats plain numpy (below it,
+# the evaluator's setup cost dominates)
+_NUMEXPR_MIN_ROWS = 10000
 
 def calculate_event_score(row, weight=1.5):
     """
@@ -42,6 +55,62 @@ def calculate_event_score(row, weight=1.5):
         # Return a default score if calculation fails
         return -1.0
 
+# Activity score per category code (Low, Medium, High) with a trailing
+# default slot that code -1 (unknown category) wraps onto
+_ACTIVITY_BY_CODE = np.array([1.0, 2.0, 3.0, 1.0])
+
+def calculate_event_score_vec(df, weight=1.5):
+    """
+    Calculate event scores for a whole DataFrame in one vectorized pass
+
+    Applies the calculate_event_score formula column-wise with numpy
+    ufuncs instead of invoking the scalar function once per row via
+    DataFrame.apply(axis=1).
+
+    Parameters:
+    -----------
+    df : pandas DataFrame
+        DataFrame containing the columns Frequency_Past_EQ,
+        Nearby_Fault_Activity and Time_Since_Last_Event
+    weight : float, optional
+        Weight factor for fault activity, by default 1.5
+
+    Returns:
+    --------
+    numpy ndarray
+        Log-probability scores, one per row, rounded to 4 decimals
+    """
+    if '_fault_numeric' in df.columns:
+        # load_data already translated the categories to activity scores
+        activity = df['_fault_numeric'].to_numpy(dtype=np.float64)
+    elif isinstance(df['Nearby_Fault_Activity'].dtype, pd.CategoricalDtype):
+        # load_data pins the categories to ['Low', 'Medium', 'High'], so
+        # the activity score is just code + 1; unknown values have code
+        # -1, which indexes the trailing default slot
+        codes = df['Nearby_Fault_Activity'].cat.codes.to_numpy()
+        activity = _ACTIVITY_BY_CODE[codes]
+    else:
+        activity_mapping = {'Low': 1, 'Medium': 2, 'High': 3}
+        activity = df['Nearby_Fault_Activity'].map(activity_mapping).fillna(1).to_numpy(dtype=np.float64)
+
+    frequency = pd.to_numeric(df['Frequency_Past_EQ'], errors='coerce').to_numpy(dtype=np.float64)
+    time_since_last = pd.to_numeric(df['Time_Since_Last_Event'], errors='coerce').to_numpy(dtype=np.float64)
+
+    # Same formula as calculate_event_score, applied to whole columns.
+    # Unparseable values were coerced to NaN above; map those rows to the
+    # scalar function's -1.0 default instead of raising per row.
+    if ne is not None and len(frequency) >= _NUMEXPR_MIN_ROWS:
+        score = ne.evaluate(
+            'log((freq + weight * act) / (t + 1.0))',
+            local_dict={'freq': frequency, 'act': activity,
+                        't': time_since_last, 'weight': weight}
+        )
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = np.log((frequency + weight * activity) / (time_since_last + 1.0))
+    score = np.where(np.isnan(frequency) | np.isnan(time_since_last), -1.0, score)
+    return np.round(score, 4)
+
 def assign_event_risk_zone(df, n_clusters=3):
     """
     Divide regions into risk propensity zones using clustering
@@ -58,31 +127,50 @@ def assign_event_risk_zone(df, n_clusters=3):
     pandas DataFrame
         DataFrame with added columns for Risk_Propensity_Score and Event_Zone
     """
-    # Create a copy to avoid modifying the original
-    result_df = df.copy()
-    
-    # Map text-based fault activity to numeric values
-    activity_mapping = {'Low': 1, 'Medium': 2, 'High': 3}
-    
-    # Create numeric columns for clustering
-    result_df['Nearby_Fault_Activity_numeric'] = result_df['Nearby_Fault_Activity'].map(activity_mapping).fillna(1)
-    
-    # Ensure numeric columns
-    numeric_columns = ['Frequency_Past_EQ', 'Average_Magnitude', 'Time_Since_Last_Event', 'Nearby_Fault_Activity_numeric']
-    for col in numeric_columns:
-        if col in result_df.columns:
-            result_df[col] = pd.to_numeric(result_df[col], errors='coerce').fillna(0)
-    
-    # Calculate risk propensity score
-    result_df['Risk_Propensity_Score'] = result_df.apply(calculate_event_score, axis=1)
-    
+    # Create numeric columns for clustering, reusing the translation
+    # load_data precomputed when it is present
+    if '_fault_numeric' in df.columns:
+        activity_numeric = pd.to_numeric(df['_fault_numeric'], errors='coerce').fillna(1)
+    else:
+        activity_mapping = {'Low': 1, 'Medium': 2, 'High': 3}
+        activity_numeric = df['Nearby_Fault_Activity'].map(activity_mapping).fillna(1)
+
+    # Coerce the clustering features without copying the whole frame;
+    # .assign below attaches the new columns while the unchanged ones
+    # keep sharing df's buffers
+    feature_series = [activity_numeric]
+    for col in ['Frequency_Past_EQ', 'Average_Magnitude', 'Time_Since_Last_Event']:
+        if col in df.columns:
+            feature_series.append(pd.to_numeric(df[col], errors='coerce').fillna(0))
+
+    # Calculate risk propensity score (vectorized over all rows)
+    result_df = df.assign(
+        Nearby_Fault_Activity_numeric=activity_numeric,
+        Risk_Propensity_Score=calculate_event_score_vec(df)
+    )
+
     # Prepare features for clustering
     try:
-        features = result_df[numeric_columns].values
-        
-        # Apply KMeans clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        result_df['Event_Zone'] = kmeans.fit_predict(features)
+        features = np.column_stack([s.to_numpy(dtype=np.float64) for s in feature_series])
+
+        # Standardize in place: the columns span very different ranges
+        # (counts, magnitudes, years) and unscaled features force extra
+        # iterations to converge
+        std = features.std(axis=0)
+        std[std == 0] = 1.0
+        features = (features - features.mean(axis=0)) / std
+
+        # scipy's kmeans2 is a single-pass C implementation with none of
+        # sklearn's estimator machinery — plenty for 3 clusters over a
+        # few hundred cities; fall back to mini-batches for genuinely
+        # large frames
+        if len(result_df) < 5000:
+            _, labels = kmeans2(features.astype(np.float32), n_clusters,
+                                seed=42, minit='++', iter=20)
+        else:
+            kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=1024, n_init=3, random_state=42)
+            labels = kmeans.fit_predict(features)
+        result_df['Event_Zone'] = labels
     except Exception as e:
         # If clustering fails, assign zones based on risk score
         print(f"KMeans clustering failed: {e}")
@@ -5,6 +5,43 @@ Hazard Module: Estimates severity if an earthquake occurs
 import pandas as pd
 import numpy as np
 
+# numba is optional: when it is installed the batched hazard kernel is
+# JIT-compiled to native code, otherwise the same function runs as plain
+# numpy ufuncs.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Fault and soil factor tables, built once at import and shared by the
+# scalar and batched paths. The arrays are laid out in category-code
+# order with a trailing default slot that code -1 (unknown category)
+# wraps onto, so batched lookups are a single gather.
+_FAULT_ACTIVITY_MAP = {'Low': 0.3, 'Medium': 0.6, 'High': 1.0}
+_SOIL_AMPLIFICATION_MAP = {
+    'Rock': 0.8,
+    'Stiff': 1.0,
+    'Soft': 1.3,
+    'Very Soft': 1.6
+}
+_FAULT_F = np.array([0.3, 0.6, 1.0, 0.3], dtype=np.float32)
+_SOIL_AMP = np.array([0.8, 1.0, 1.3, 1.6, 1.0], dtype=np.float32)
+
+def _hazard_kernel(avg_magnitude, depth_km, fault_activity, soil_factor):
+    """Numeric core of the hazard score, separated from pandas extraction
+    so it can be JIT-compiled and reused for batches of any size."""
+    magnitude_component = avg_magnitude * 0.7
+    depth_component = (15.0 / (depth_km + 5.0)) * 2.0
+    fault_component = fault_activity * 3.0
+
+    hazard_score = (magnitude_component + depth_component + fault_component) * soil_factor
+
+    # Normalize to 0-10 scale
+    return np.minimum(10.0, np.maximum(0.0, hazard_score))
+
+if njit is not None:
+    _hazard_kernel = njit(fastmath=True, cache=True)(_hazard_kernel)
+
 def calculate_hazard_score(row):
     """
     Calculate hazard score based on earthquake parameters
@@ -29,17 +66,10 @@ def calculate_hazard_score(row):
         depth_km = float(row.get('Depth_km', 10))  # Default to 10km if missing
         
         # Convert fault activity to numeric
-        fault_activity_map = {'Low': 0.3, 'Medium': 0.6, 'High': 1.0}
-        fault_activity = fault_activity_map.get(row.get('Nearby_Fault_Activity', 'Low'), 0.3)
-        
+        fault_activity = _FAULT_ACTIVITY_MAP.get(row.get('Nearby_Fault_Activity', 'Low'), 0.3)
+
         # Include soil amplification if available
-        soil_amplification_map = {
-            'Rock': 0.8,
-            'Stiff': 1.0,
-            'Soft': 1.3,
-            'Very Soft': 1.6
-        }
-        soil_factor = soil_amplification_map.get(row.get('Soil_Type', 'Stiff'), 1.0)
+        soil_factor = _SOIL_AMPLIFICATION_MAP.get(row.get('Soil_Type', 'Stiff'), 1.0)
         
         # Calculate hazard components
         magnitude_component = avg_magnitude * 0.7  # Scale magnitude impact (typically 4-8)
@@ -58,15 +88,71 @@ def calculate_hazard_score(row):
         # Return a default score if calculation fails
         return 5.0  # Mid-range default
 
+def calculate_hazard_score_vec(df):
+    """
+    Calculate hazard scores for a whole DataFrame in one vectorized pass
+
+    Operates column-wise with numpy ufuncs instead of calling
+    calculate_hazard_score once per row, which avoids the per-row
+    Python overhead of DataFrame.apply(axis=1).
+
+    Parameters:
+    -----------
+    df : pandas DataFrame
+        DataFrame containing the columns Average_Magnitude, Depth_km,
+        Nearby_Fault_Activity and (optionally) Soil_Type
+
+    Returns:
+    --------
+    numpy ndarray
+        Hazard scores on a 0-10 scale, one per row
+    """
+    # Ensure contiguous float arrays for the numeric columns
+    avg_magnitude = pd.to_numeric(df['Average_Magnitude'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+    depth_km = pd.to_numeric(df['Depth_km'], errors='coerce').fillna(10).to_numpy(dtype=np.float64)
+
+    # Map categorical factors to numeric arrays, reusing the columns
+    # load_data precomputed when they are present
+    if '_fault_numeric' in df.columns:
+        # _fault_numeric holds activity levels 1/2/3; translate to the
+        # 0.3/0.6/1.0 hazard weights with a gather
+        fault_activity = _FAULT_F[df['_fault_numeric'].to_numpy() - 1]
+    elif isinstance(df['Nearby_Fault_Activity'].dtype, pd.CategoricalDtype):
+        fault_activity = _FAULT_F[df['Nearby_Fault_Activity'].cat.codes.to_numpy()]
+    else:
+        fault_activity = df['Nearby_Fault_Activity'].map(_FAULT_ACTIVITY_MAP).fillna(0.3).to_numpy(dtype=np.float64)
+
+    if '_soil_amp' in df.columns:
+        soil_factor = df['_soil_amp'].to_numpy(dtype=np.float64)
+    elif 'Soil_Type' in df.columns:
+        if isinstance(df['Soil_Type'].dtype, pd.CategoricalDtype):
+            soil_factor = _SOIL_AMP[df['Soil_Type'].cat.codes.to_numpy()]
+        else:
+            soil_factor = df['Soil_Type'].map(_SOIL_AMPLIFICATION_MAP).fillna(1.0).to_numpy(dtype=np.float64)
+    else:
+        soil_factor = np.full(len(df), 1.0)
+
+    # Same formula as calculate_hazard_score, applied to whole arrays in
+    # the (optionally JIT-compiled) numeric kernel
+    hazard_score = _hazard_kernel(avg_magnitude, depth_km, fault_activity, soil_factor)
+
+    return np.round(hazard_score, 2)
+
+# Shared hazard-level bins: inner edges for the scalar searchsorted path
+# and full edges/labels for the vectorized pd.cut path
+_HAZARD_EDGES = np.array([3.5, 6.0, 8.0])
+_HAZARD_BINS = [-np.inf, 3.5, 6.0, 8.0, np.inf]
+_HAZARD_LABELS = ["Low", "Moderate", "High", "Very High"]
+
 def categorize_hazard_level(hazard_score):
     """
     Categorize hazard score into qualitative hazard level
-    
+
     Parameters:
     -----------
     hazard_score : float
         Hazard score on a 0-10 scale
-    
+
     Returns:
     --------
     str
@@ -74,14 +160,27 @@ def categorize_hazard_level(hazard_score):
     """
     try:
         score = float(hazard_score)
-        
-        if score < 3.5:
-            return "Low"
-        elif score < 6.0:
-            return "Moderate"
-        elif score < 8.0:
-            return "High"
-        else:
-            return "Very High"
+
+        return _HAZARD_LABELS[np.searchsorted(_HAZARD_EDGES, score, side='right')]
     except:
-        return "Moderate"  # Default if conversion fails
\ No newline at end of file
+        return "Moderate"  # Default if conversion fails
+
+def categorize_hazard_level_vec(scores):
+    """
+    Categorize a whole array of hazard scores in one pass
+
+    Parameters:
+    -----------
+    scores : array-like of float
+        Hazard scores on a 0-10 scale
+
+    Returns:
+    --------
+    pandas Categorical
+        Hazard level per score, using the same bins as
+        categorize_hazard_level
+    """
+    # right=False makes the intervals left-closed ([3.5, 6.0) etc.) so
+    # scores exactly on an edge take the upper label, matching the
+    # scalar searchsorted(..., side='right') path
+    return pd.cut(pd.Series(scores), bins=_HAZARD_BINS, labels=_HAZARD_LABELS, right=False)
\ No newline at end of file
@@ -5,27 +5,66 @@ Utility functions for the Earthquake Risk Assessment App
 import pandas as pd
 import numpy as np
 import os
+import types
+from functools import lru_cache
+
+# Only these columns feed the scoring modules; the dataset CSV carries
+# many precomputed filler columns that are rederived by the app anyway.
+# Declaring dtypes up front skips pandas' inference pass (and the old
+# re-coercion step), and category dtype keeps the two string columns
+# cheap to map downstream.
+_CSV_COLUMNS = {
+    'City', 'Frequency_Past_EQ', 'Average_Magnitude', 'Time_Since_Last_Event',
+    'Nearby_Fault_Activity', 'Depth_km', 'Soil_Type'
+}
+_CSV_DTYPES = {
+    'City': 'string',
+    'Frequency_Past_EQ': 'float32',
+    'Average_Magnitude': 'float32',
+    'Time_Since_Last_Event': 'float32',
+    'Depth_km': 'float32',
+    'Nearby_Fault_Activity': 'category',
+    'Soil_Type': 'category'
+}
 
 def load_data(file_path):
     """
     Load and preprocess earthquake risk dataset
-    
+
+    The parsed dataset is memoized on (path, mtime), so repeated calls
+    (Streamlit reruns) skip the CSV parse until the file changes on
+    disk.
+
     Parameters:
     -----------
     file_path : str
         Path to the CSV file
-    
+
     Returns:
     --------
     pandas DataFrame
-        Preprocessed DataFrame
+        Preprocessed DataFrame (a copy; callers may mutate it freely)
     """
     # Check if file exists
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Data file not found: {file_path}")
-    
-    # Load the CSV file
-    df = pd.read_csv(file_path)
+
+    return _load_data_cached(file_path, os.path.getmtime(file_path)).copy()
+
+@lru_cache(maxsize=8)
+def _load_data_cached(file_path, mtime):
+    """
+    Parse and preprocess the CSV; mtime is part of the cache key so an
+    updated file invalidates the cached frame.
+    """
+    # Load the CSV file: only the columns the app uses, with dtypes
+    # declared so the parser does a single typed pass
+    df = pd.read_csv(
+        file_path,
+        usecols=lambda col: col in _CSV_COLUMNS,
+        dtype=_CSV_DTYPES,
+        engine='c'
+    )
     
     # Ensure required columns exist
     required_columns = [
@@ -33,6 +72,11 @@ def load_data(file_path):
         'Time_Since_Last_Event', 'Nearby_Fault_Activity'
     ]
     
+    # Synthesize any missing columns from a single seeded Generator so
+    # repeated loads are reproducible (and draws avoid the legacy global
+    # RandomState locking)
+    rng = np.random.default_rng(0)
+
     missing_columns = [col for col in required_columns if col not in df.columns]
     if missing_columns:
         # Create missing columns with default values
@@ -40,33 +84,71 @@ def load_data(file_path):
             if col == 'City':
                 df['City'] = [f'City_{i}' for i in range(len(df))]
             elif col == 'Frequency_Past_EQ':
-                df['Frequency_Past_EQ'] = np.random.randint(1, 10, len(df))
+                df['Frequency_Past_EQ'] = rng.integers(1, 10, len(df))
             elif col == 'Average_Magnitude':
-                df['Average_Magnitude'] = np.random.uniform(4.0, 7.5, len(df)).round(1)
+                df['Average_Magnitude'] = rng.uniform(4.0, 7.5, len(df)).round(1)
             elif col == 'Time_Since_Last_Event':
-                df['Time_Since_Last_Event'] = np.random.randint(1, 20, len(df))
+                df['Time_Since_Last_Event'] = rng.integers(1, 20, len(df))
             elif col == 'Nearby_Fault_Activity':
-                df['Nearby_Fault_Activity'] = np.random.choice(['Low', 'Medium', 'High'], len(df))
-    
+                df['Nearby_Fault_Activity'] = rng.choice(['Low', 'Medium', 'High'], len(df))
+
     # Add Depth_km if missing
     if 'Depth_km' not in df.columns:
-        df['Depth_km'] = np.random.randint(5, 30, len(df))
-    
+        df['Depth_km'] = rng.integers(5, 30, len(df))
+
     # Add Soil_Type if missing
     if 'Soil_Type' not in df.columns:
-        df['Soil_Type'] = np.random.choice(['Rock', 'Stiff', 'Soft', 'Very Soft'], len(df))
-    
-    # Convert columns to appropriate types
-    df['Frequency_Past_EQ'] = pd.to_numeric(df['Frequency_Past_EQ'], errors='coerce').fillna(0)
-    df['Average_Magnitude'] = pd.to_numeric(df['Average_Magnitude'], errors='coerce').fillna(5.0)
-    df['Time_Since_Last_Event'] = pd.to_numeric(df['Time_Since_Last_Event'], errors='coerce').fillna(5)
-    df['Depth_km'] = pd.to_numeric(df['Depth_km'], errors='coerce').fillna(10)
+        df['Soil_Type'] = rng.choice(['Rock', 'Stiff', 'Soft', 'Very Soft'], len(df))
     
+    # Dtypes are enforced at parse time; just fill any gaps with the
+    # usual defaults
+    df['Frequency_Past_EQ'] = df['Frequency_Past_EQ'].fillna(0)
+    df['Average_Magnitude'] = df['Average_Magnitude'].fillna(5.0)
+    df['Time_Since_Last_Event'] = df['Time_Since_Last_Event'].fillna(5)
+    df['Depth_km'] = df['Depth_km'].fillna(10)
+
+    # Compact numeric dtypes: scoring is memory-bound, so halving the
+    # bytes per column pays directly in ufunc traffic. Frequencies,
+    # magnitudes and depths are fractional in the dataset and stay
+    # float32 (also covers the synthesized-column path, which produces
+    # 64-bit arrays); elapsed years are whole and fit int16.
+    df['Frequency_Past_EQ'] = df['Frequency_Past_EQ'].astype('float32')
+    df['Average_Magnitude'] = df['Average_Magnitude'].astype('float32')
+    df['Depth_km'] = df['Depth_km'].astype('float32')
+    df['Time_Since_Last_Event'] = df['Time_Since_Last_Event'].astype('int16')
+
+    # Pin the two categorical columns to fixed, ordered category sets so
+    # scorers can translate them to numeric factors via 1-byte integer
+    # codes instead of hashing strings. Synonym spellings seen in the
+    # wild ('Moderate', 'Rocky') are normalized first; anything else
+    # becomes code -1 and falls back to the scorers' defaults.
+    fault_raw = df['Nearby_Fault_Activity'].astype('object').replace({'Moderate': 'Medium'})
+    soil_raw = df['Soil_Type'].astype('object').replace({'Rocky': 'Rock'})
+    df['Nearby_Fault_Activity'] = pd.Categorical(
+        fault_raw, categories=['Low', 'Medium', 'High'], ordered=True
+    )
+    df['Soil_Type'] = pd.Categorical(
+        soil_raw, categories=['Rock', 'Stiff', 'Soft', 'Very Soft'], ordered=True
+    )
+
+    # Translate the categoricals to the numeric factors the scorers need
+    # once per load, instead of every scorer re-mapping per call. The
+    # lookup arrays carry a trailing default slot that code -1 (unknown
+    # category) wraps onto.
+    fault_codes = df['Nearby_Fault_Activity'].cat.codes.to_numpy()
+    soil_codes = df['Soil_Type'].cat.codes.to_numpy()
+    df['_fault_numeric'] = np.array([1, 2, 3, 1], dtype='int8')[fault_codes]
+    df['_soil_amp'] = np.array([0.8, 1.0, 1.3, 1.6, 1.0], dtype='float32')[soil_codes]
+
     return df
 
+@lru_cache(maxsize=128)
 def format_currency(amount, currency="₹"):
     """
     Format a number as currency
+
+    Memoized: the app formats the same handful of values several times
+    per rerun, so repeated calls become a dict lookup.
     
     Parameters:
     -----------
@@ -96,27 +178,63 @@ def format_currency(amount, currency="₹"):
     except:
         return f"{currency}0.00"
 
+# Scale thresholds, divisors and suffixes shared with format_currency's
+# if/elif ladder, laid out for searchsorted indexing
+_CURRENCY_THRESHOLDS = np.array([1000, 100000, 10000000])
+_CURRENCY_DIVISORS = np.array([1.0, 1000.0, 100000.0, 10000000.0])
+_CURRENCY_SUFFIXES = ('', 'K', ' Lakh', ' Crore')
+
+def format_currency_series(amounts, currency="₹"):
+    """
+    Format an array of amounts as currency strings in one pass
+
+    Resolves the scale bracket for every amount with a single
+    np.searchsorted call instead of running format_currency's Python
+    comparison ladder per value.
+
+    Parameters:
+    -----------
+    amounts : array-like of float
+        Amounts to format
+    currency : str, optional
+        Currency symbol, by default "₹"
+
+    Returns:
+    --------
+    list of str
+        Formatted currency strings, one per amount
+    """
+    values = np.nan_to_num(np.asarray(amounts, dtype=np.float64))
+
+    idx = np.searchsorted(_CURRENCY_THRESHOLDS, values, side='right')
+    scaled = values / _CURRENCY_DIVISORS[idx]
+
+    return [f"{currency}{value:.2f}{_CURRENCY_SUFFIXES[i]}"
+            for value, i in zip(scaled, idx)]
+
+# Frozen scenario multiplier table, built once at import instead of per
+# call
+_SCENARIO_MULT = types.MappingProxyType({
+    'Best Case': 0.7,
+    'Expected Case': 1.0,
+    'Worst Case': 1.5
+})
+
 def get_scenario_multiplier(scenario):
     """
     Get modifier multiplier based on scenario type
-    
+
     Parameters:
     -----------
     scenario : str
         Scenario type ('Best Case', 'Expected Case', 'Worst Case')
-    
+
     Returns:
     --------
     float
         Multiplier for scenario calculations
     """
-    multipliers = {
-        'Best Case': 0.7,
-        'Expected Case': 1.0,
-        'Worst Case': 1.5
-    }
-    
-    return multipliers.get(scenario, 1.0)
+    return _SCENARIO_MULT.get(scenario, 1.0)
 
 def create_init_file():
     """